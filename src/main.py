@@ -1,54 +1,95 @@
 import curses
 import os
-import select
+import selectors
 import subprocess
+import time
+from collections import OrderedDict, deque
 from curses import wrapper
+from itertools import islice
 
 START_DIR_DEFAULT = "/sdcard/"
+LS_CACHE_MAX = 64  # directories kept in the ls cache before LRU eviction
+LS_CHUNK = 64  # listing entries consumed per main-loop tick while loading
+HELP_TEXT = "TAB:select  j/k:move  c:clear  s:show  o:copy"
 
 
 SELECTED_COLOR = 1  # Yellow on Blue
 HIGHLIGHT_COLOR = 2  # White on Red (cursor + selected)
 NORMAL_COLOR = 3  # Default
 
+# Resolved attrs, filled in by init_colors once curses is up.
+SELECTED_ATTR = 0
+HIGHLIGHT_ATTR = 0
+NORMAL_ATTR = 0
+
 
 def init_colors():
+    global SELECTED_ATTR, HIGHLIGHT_ATTR, NORMAL_ATTR
     curses.start_color()
     curses.init_pair(SELECTED_COLOR, curses.COLOR_YELLOW, curses.COLOR_BLUE)
     curses.init_pair(HIGHLIGHT_COLOR, curses.COLOR_WHITE, curses.COLOR_RED)
     curses.init_pair(NORMAL_COLOR, curses.COLOR_WHITE, curses.COLOR_BLACK)
+    SELECTED_ATTR = curses.color_pair(SELECTED_COLOR)
+    HIGHLIGHT_ATTR = curses.color_pair(HIGHLIGHT_COLOR)
+    NORMAL_ATTR = curses.color_pair(NORMAL_COLOR)
 
 
 class FileBrowser:
     def __init__(self, start_dir: str = START_DIR_DEFAULT):
         self.current_dir = start_dir
-        self.dirs: list[str] = []
-        self.files: list[str] = []
         self.all_items: list[str] = []
+        self.n_dirs: int = 0  # all_items[:n_dirs] are directories
         self.highlighted_idx: int = 0
         self.start_idx: int = 0
-        self.selected_set: set[int] = set()
-        self._ls_cmd = ["adb", "shell", "ls", "-p", self.current_dir]
+        self.selected_set: set[str] = set()
+        self._ls_cache: OrderedDict[str, tuple[list[str], int]] = OrderedDict()
+        self._dirty = True  # set by mutators, cleared once drawn
+        self._pending_ls = None  # generator of a listing still streaming in
+        self._last_frame: list[tuple[str, int]] | None = None  # rows drawn last frame
+        self._display_cache: list[str] | None = None  # names truncated to width
+        self._cache_width = 0
+        self._status = ""
+        self._status_key: tuple[str, int] | None = None  # (dir, sel count)
+        self._prev_highlighted_idx = 0
+        self._cursor_only_change = False  # last mutation moved only the cursor
+        self._scroll_delta = 0  # +1/-1 when the last move scrolled by one row
         self.reload_dir(reset_cursor=True, reset_scroll=True, max_height=None)
 
     # -------- Directory handling --------
 
-    def _run_ls(self) -> list[str]:
-        self._ls_cmd[-1] = self.current_dir
-        out = (
-            subprocess.run(self._ls_cmd, capture_output=True, text=True)
-            .stdout.strip()
-            .splitlines()
+    def _run_ls(self):
+        cmd = ["adb", "shell", "ls", "-p", self.current_dir]
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
         )
-        return out
+        if proc.stdout is None:
+            proc.wait()
+            return
+        try:
+            for line in proc.stdout:
+                yield line.rstrip(b"\n")
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.terminate()
+            proc.wait()
 
     def reload_dir(
         self, reset_cursor: bool, reset_scroll: bool, max_height: int | None
     ):
-        out = self._run_ls()
-        self.files = [f for f in out if not f.endswith("/")]
-        self.dirs = [f for f in out if f.endswith("/")]
-        self.all_items = self.dirs + self.files
+        if self._pending_ls is not None:
+            self._pending_ls.close()
+            self._pending_ls = None
+
+        cached = self._ls_cache.get(self.current_dir)
+        if cached is not None:
+            self._ls_cache.move_to_end(self.current_dir)
+            self.all_items, self.n_dirs = cached
+        else:
+            self.all_items = []
+            self.n_dirs = 0
+            self._pending_ls = self._run_ls()
+            self._continue_load()
 
         if reset_cursor:
             self.highlighted_idx = 0
@@ -63,17 +104,65 @@ class FileBrowser:
             if max_height is not None:
                 self.start_idx = max(0, self.start_idx - (max_height - 2))
 
-        self.selected_set.clear()
+        self._dirty = True
+        self._last_frame = None
+        self._display_cache = None
+        self._cursor_only_change = False
+        self._scroll_delta = 0
+
+    def _continue_load(self):
+        gen = self._pending_ls
+        if gen is None:
+            return
+
+        dirs: list[str] = []
+        files: list[str] = []
+        done = False
+        for _ in range(LS_CHUNK):
+            line = next(gen, None)
+            if line is None:
+                done = True
+                break
+            if not line:
+                continue
+            (dirs if line.endswith(b"/") else files).append(
+                line.decode("utf-8", "replace")
+            )
+
+        if dirs:
+            self.all_items[self.n_dirs : self.n_dirs] = dirs
+            self.n_dirs += len(dirs)
+        if files:
+            self.all_items.extend(files)
+        if dirs or files:
+            self._dirty = True
+            self._display_cache = None
+            self._cursor_only_change = False
+            self._scroll_delta = 0
+
+        if done:
+            self._pending_ls = None
+            self._ls_cache[self.current_dir] = (self.all_items, self.n_dirs)
+            if len(self._ls_cache) > LS_CACHE_MAX:
+                self._ls_cache.popitem(last=False)
+
+    def is_loading(self) -> bool:
+        return self._pending_ls is not None
+
+    def invalidate(self, dir_path: str):
+        self._ls_cache.pop(dir_path, None)
 
     def go_up_directory(self, max_height: int):
         if self.current_dir in ["/", START_DIR_DEFAULT]:
             return
         new_dir = os.path.dirname(self.current_dir.rstrip("/")) + "/"
         self.current_dir = new_dir
+        self.clear_selection()
         self.reload_dir(reset_cursor=False, reset_scroll=False, max_height=max_height)
 
     def go_home(self, max_height: int):
         self.current_dir = START_DIR_DEFAULT
+        self.clear_selection()
         self.reload_dir(reset_cursor=True, reset_scroll=True, max_height=max_height)
 
     def enter_directory_under_cursor(self, max_height: int):
@@ -82,64 +171,156 @@ class FileBrowser:
         item = self.all_items[self.highlighted_idx]
         if item.endswith("/"):
             self.current_dir += item
+            self.clear_selection()
             self.reload_dir(reset_cursor=True, reset_scroll=True, max_height=max_height)
 
     # -------- Navigation & selection --------
 
     def move_down(self, max_height: int):
         if self.highlighted_idx < len(self.all_items) - 1:
+            self._prev_highlighted_idx = self.highlighted_idx
             self.highlighted_idx += 1
             if self.highlighted_idx >= self.start_idx + max_height - 2:
                 self.start_idx += 1 # scroll
+                self._cursor_only_change = False
+                self._scroll_delta = 1
+            else:
+                self._cursor_only_change = True
+            self._dirty = True
 
     def move_up(self):
         if self.highlighted_idx > 0:
+            self._prev_highlighted_idx = self.highlighted_idx
             self.highlighted_idx -= 1
             if self.highlighted_idx < self.start_idx:
                 self.start_idx -= 1
+                self._cursor_only_change = False
+                self._scroll_delta = -1
+            else:
+                self._cursor_only_change = True
+            self._dirty = True
 
     def toggle_select_current(self,max_height: int | None):
-        if self.highlighted_idx < len(self.dirs):
+        if not self.all_items or self.highlighted_idx < self.n_dirs:
             return
-        if self.highlighted_idx in self.selected_set:
-            self.selected_set.remove(self.highlighted_idx)
+        name = self.all_items[self.highlighted_idx]
+        if name in self.selected_set:
+            self.selected_set.discard(name)
         else:
-            self.selected_set.add(self.highlighted_idx)
+            self.selected_set.add(name)
             if max_height is not None:
               self.move_down(max_height)
+        self._dirty = True
+        self._cursor_only_change = False
+        self._scroll_delta = 0
 
 
     def clear_selection(self):
         self.selected_set.clear()
+        self._dirty = True
+        self._cursor_only_change = False
+        self._scroll_delta = 0
+
+    def _attr_for(self, global_idx: int) -> int:
+        is_sel = self.all_items[global_idx] in self.selected_set
+        is_cur = global_idx == self.highlighted_idx
+        if is_sel:
+            return HIGHLIGHT_ATTR if is_cur else SELECTED_ATTR
+        return NORMAL_ATTR | curses.A_REVERSE if is_cur else NORMAL_ATTR
+
+    def _draw_cursor_rows(self, stdscr: curses.window, max_height: int):
+        for global_idx in (self._prev_highlighted_idx, self.highlighted_idx):
+            row = global_idx - self.start_idx
+            if not 0 <= row < max_height - 2 or global_idx >= len(self.all_items):
+                continue
+            text = self._display_cache[global_idx]
+            attr = self._attr_for(global_idx)
+            self._last_frame[row] = (text, attr)
+            stdscr.move(row, 0)
+            stdscr.clrtoeol()
+            stdscr.addstr(row, 0, text, attr)
+        stdscr.refresh()
 
-    def draw(self, stdscr: curses.window, max_height: int, max_width: int):
-        stdscr.clear()
-        end = min(self.start_idx + max_height - 2, len(self.all_items))
-
-        for idx, item in enumerate(self.all_items[self.start_idx : end]):
-            global_idx = idx + self.start_idx
-            display_item = item
-            if len(display_item) > max_width - 1:
-                display_item = display_item[: max_width - 4] + "..."
+    def _draw_scroll_step(self, stdscr: curses.window, max_height: int, delta: int):
+        list_rows = max_height - 2
+        stdscr.setscrreg(0, list_rows - 1)
+        stdscr.scrollok(True)
+        stdscr.scroll(delta)
+        stdscr.scrollok(False)
 
-            attr = curses.color_pair(NORMAL_COLOR)
+        blank = ("", curses.A_NORMAL)
+        if delta == 1:
+            self._last_frame[:list_rows] = self._last_frame[1:list_rows] + [blank]
+        else:
+            self._last_frame[:list_rows] = [blank] + self._last_frame[: list_rows - 1]
 
-            if global_idx in self.selected_set:
-                attr = curses.color_pair(SELECTED_COLOR)
+        revealed = self.start_idx + (list_rows - 1 if delta == 1 else 0)
+        for global_idx in {revealed, self._prev_highlighted_idx, self.highlighted_idx}:
+            row = global_idx - self.start_idx
+            if not 0 <= row < list_rows or global_idx >= len(self.all_items):
+                continue
+            text = self._display_cache[global_idx]
+            attr = self._attr_for(global_idx)
+            self._last_frame[row] = (text, attr)
+            stdscr.move(row, 0)
+            stdscr.clrtoeol()
+            stdscr.addstr(row, 0, text, attr)
+        stdscr.refresh()
 
-            if global_idx == self.highlighted_idx:
-                if global_idx in self.selected_set:
-                    attr = curses.color_pair(HIGHLIGHT_COLOR)
-                else:
-                    attr |= curses.A_REVERSE
+    def draw(self, stdscr: curses.window, max_height: int, max_width: int):
+        end = min(self.start_idx + max_height - 2, len(self.all_items))
 
-            stdscr.addstr(idx, 0, display_item, attr)
+        if self._display_cache is None or self._cache_width != max_width:
+            w = max_width - 1
+            self._display_cache = [
+                it if len(it) <= w else it[: max_width - 4] + "..."
+                for it in self.all_items
+            ]
+            self._cache_width = max_width
+
+        if self._cursor_only_change and self._last_frame is not None:
+            self._cursor_only_change = False
+            self._draw_cursor_rows(stdscr, max_height)
+            return
 
-        status = f"Dir: {self.current_dir} | Sel: {len(self.selected_set)} | q:quit h:up =:home"
-        help_text = "TAB:select  j/k:move  c:clear  s:show  o:copy"
+        # A scrolling region needs at least one list row; fall back to the
+        # full diff draw on terminals too short for one.
+        if (
+            self._scroll_delta
+            and self._last_frame is not None
+            and max_height - 2 >= 1
+        ):
+            delta = self._scroll_delta
+            self._scroll_delta = 0
+            self._draw_scroll_step(stdscr, max_height, delta)
+            return
+        self._scroll_delta = 0
+
+        frame: list[tuple[str, int]] = []
+        for display_item in self._display_cache[self.start_idx : end]:
+            global_idx = len(frame) + self.start_idx
+            frame.append((display_item, self._attr_for(global_idx)))
+
+        while len(frame) < max_height - 2:
+            frame.append(("", curses.A_NORMAL))
+
+        status_key = (self.current_dir, len(self.selected_set))
+        if status_key != self._status_key:
+            self._status = f"Dir: {self.current_dir} | Sel: {len(self.selected_set)} | q:quit h:up =:home"
+            self._status_key = status_key
+        frame.append((self._status[: max_width - 1], curses.A_BOLD))
+        frame.append((HELP_TEXT[: max_width - 1], curses.A_NORMAL))
+
+        last = self._last_frame
+        for row, (text, attr) in enumerate(frame):
+            if last is not None and row < len(last) and last[row] == (text, attr):
+                continue
+            stdscr.move(row, 0)
+            stdscr.clrtoeol()
+            if text:
+                stdscr.addstr(row, 0, text, attr)
 
-        stdscr.addstr(max_height - 2, 0, status[: max_width - 1], curses.A_BOLD)
-        stdscr.addstr(max_height - 1, 0, help_text[: max_width - 1])
+        self._last_frame = frame
         stdscr.refresh()
 
     def has_items(self) -> bool:
@@ -147,8 +328,8 @@ class FileBrowser:
 
     def get_targets_for_copy(self) -> list[str]:
         if self.selected_set:
-            return [self.all_items[i] for i in self.selected_set]
-        if not self.all_items: # If the list is empty 
+            return list(self.selected_set)
+        if not self.all_items: # If the list is empty
             return []
         return [self.all_items[self.highlighted_idx]]
 
@@ -156,12 +337,18 @@ class FileBrowser:
         return self.all_items
 
     def get_selected_files_for_notify(self) -> list[str]:
-        return [self.all_items[i] for i in self.selected_set]
+        return list(self.selected_set)
+
+
+LOG_PAINT_INTERVAL = 0.033  # live tail repaints capped at ~30 Hz
+LOG_MAX_LINES = 10_000  # oldest log lines are evicted past this
 
 
 class LogTerminal:
     def __init__(self):
-        self.lines: list[str] = []
+        self.lines: deque[bytes] = deque(maxlen=LOG_MAX_LINES)
+        self._last_paint = 0.0
+        self._pending_overwrite = False  # lines[-1] mirrors an unfinished \r line
 
     def _draw_live_tail(self, stdscr: curses.window):
         max_h, max_w = stdscr.getmaxyx()
@@ -177,53 +364,83 @@ class LogTerminal:
 
         start = max(0, len(self.lines) - visible_height)
         row = 1
-        for line in self.lines[start : start + visible_height]:
+        for line in islice(self.lines, start, start + visible_height):
             if row >= max_h:
                 break
-            stdscr.addstr(row, 0, line[: max_w - 1])
+            stdscr.addstr(row, 0, line[: max_w - 1].decode("utf-8", "replace"))
             row += 1
 
         stdscr.refresh()
 
+    def _append_chunk(self, chunk: bytes):
+        # A finished line; \r rewrites inside it only keep their last segment.
+        # Strip the trailing \r first so CRLF endings don't blank the line.
+        if b"\r" in chunk:
+            chunk = chunk.rstrip(b"\r").rsplit(b"\r", 1)[-1]
+        if self._pending_overwrite and self.lines:
+            self.lines[-1] = chunk
+            self._pending_overwrite = False
+        else:
+            self.lines.append(chunk)
+
     def append_command_output(self, cmd: list[str], stdscr: curses.window):
-        self.lines.append(f"$ {' '.join(cmd)}")
+        self._pending_overwrite = False
+        self.lines.append(f"$ {' '.join(cmd)}".encode())
         self._draw_live_tail(stdscr)
 
         proc = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
         )
 
-        streams = []
+        sel = selectors.DefaultSelector()
+        residual = b""
         if proc.stdout is not None:
-            streams.append(proc.stdout)
-        if proc.stderr is not None:
-            streams.append(proc.stderr)
+            sel.register(proc.stdout, selectors.EVENT_READ)
 
-        while streams:
-            rlist, _, _ = select.select(streams, [], [], 0.1)
+        while sel.get_map():
+            events = sel.select(timeout=0.1)
 
-            if not rlist:
+            if not events:
                 if proc.poll() is not None:
                     break
                 continue
 
-            closed = []
-            for s in rlist:
-                line = s.readline()
-                if line == "":
-                    closed.append(s)
+            for key, _ in events:
+                data = os.read(key.fd, 65536)
+                if not data:
+                    sel.unregister(key.fileobj)
                     continue
 
-                self.lines.append(line.rstrip("\n"))
+                *chunks, residual = (residual + data).split(b"\n")
+                for chunk in chunks:
+                    self._append_chunk(chunk)
+
+                if b"\r" in residual:
+                    # In-flight progress line: show the latest rewrite now and
+                    # keep overwriting it until the \n arrives. Strip trailing
+                    # \r for display but keep it in the residual so the next
+                    # rewrite or \n still terminates this segment.
+                    tail = residual.rstrip(b"\r").rsplit(b"\r", 1)[-1]
+                    if self._pending_overwrite and self.lines:
+                        self.lines[-1] = tail
+                    else:
+                        self.lines.append(tail)
+                        self._pending_overwrite = True
+                    residual = tail + b"\r" if residual.endswith(b"\r") else tail
+
+            now = time.monotonic()
+            if now - self._last_paint >= LOG_PAINT_INTERVAL:
                 self._draw_live_tail(stdscr)
+                self._last_paint = now
 
-            for s in closed:
-                if s in streams:
-                    streams.remove(s)
+        sel.close()
+        if residual:
+            self._append_chunk(residual)
+        self._pending_overwrite = False
+        self._draw_live_tail(stdscr)
 
     def view(self, stdscr: curses.window):
         max_h, max_w = stdscr.getmaxyx()
@@ -240,10 +457,10 @@ class LogTerminal:
 
             row = 1
             end = min(scroll + visible_height, len(self.lines))
-            for line in self.lines[scroll:end]:
+            for line in islice(self.lines, scroll, end):
                 if row >= max_h:
                     break
-                stdscr.addstr(row, 0, line[: max_w - 1])
+                stdscr.addstr(row, 0, line[: max_w - 1].decode("utf-8", "replace"))
                 row += 1
 
             stdscr.refresh()
@@ -293,11 +510,11 @@ class CopyManager:
         if not targets:
             return
 
-        for name in targets:
-            src = self.browser.current_dir + name
-            cmd = ["adb", "pull", src]
-            self.terminal.append_command_output(cmd, stdscr)
+        srcs = [self.browser.current_dir + name for name in targets]
+        cmd = ["adb", "pull", *srcs, "."]
+        self.terminal.append_command_output(cmd, stdscr)
 
+        self.browser.invalidate(self.browser.current_dir)
         self.terminal.view(stdscr)
 
 
@@ -305,38 +522,48 @@ class CopyManager:
 def main(stdscr: curses.window):
     curses.curs_set(0)
     stdscr.nodelay(False)
+    stdscr.idlok(True)
     init_colors()
 
-    MAX_HEIGHT, MAX_WIDTH = stdscr.getmaxyx()
-
     browser = FileBrowser(start_dir=START_DIR_DEFAULT)
     terminal = LogTerminal()
     copy_manager = CopyManager(browser, terminal)
 
     while True:
-        browser.draw(stdscr, MAX_HEIGHT, MAX_WIDTH)
+        max_height, max_width = stdscr.getmaxyx()
+
+        if browser._dirty:
+            browser.draw(stdscr, max_height, max_width)
+            browser._dirty = False
+
+        stdscr.nodelay(browser.is_loading())
         key = stdscr.getch()
 
         if key == ord("q"):
             break
 
+        elif key == curses.KEY_RESIZE:
+            browser._last_frame = None
+            browser._display_cache = None
+            browser._dirty = True
+
         elif key == ord("j"):
-            browser.move_down(MAX_HEIGHT)
+            browser.move_down(max_height)
 
         elif key == ord("k"):
             browser.move_up()
 
         elif key in (9, ord("\t")):
-            browser.toggle_select_current(MAX_HEIGHT)
+            browser.toggle_select_current(max_height)
 
         elif key == ord("h"):
-            browser.go_up_directory(MAX_HEIGHT)
+            browser.go_up_directory(max_height)
 
         elif key == ord("l"):
-            browser.enter_directory_under_cursor(MAX_HEIGHT)
+            browser.enter_directory_under_cursor(max_height)
 
         elif key == ord("="):
-            browser.go_home(MAX_HEIGHT)
+            browser.go_home(max_height)
 
         elif key == ord("c"):
             browser.clear_selection()
@@ -344,14 +571,29 @@ def main(stdscr: curses.window):
         elif key == ord("s"):
             if browser.selected_set:
                 selected_files = browser.get_selected_files_for_notify()
-                msg = ", ".join(selected_files)
-                os.system(f'notify-send "Selected ({len(selected_files)})" "{msg}"')
+                notify_cmd = [
+                    "notify-send",
+                    f"Selected ({len(selected_files)})",
+                    ", ".join(selected_files),
+                ]
             else:
-                os.system('notify-send "No files selected"')
+                notify_cmd = ["notify-send", "No files selected"]
+            subprocess.Popen(
+                notify_cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
 
         elif key == ord("o"):
             copy_manager.run_copy_flow(stdscr)
             browser.clear_selection()
+            browser._last_frame = None  # copy flow drew over the screen
+
+        # Consume the next listing chunk only after the key was dispatched,
+        # so a move in the same tick cannot re-arm the draw fast paths that
+        # _continue_load just invalidated.
+        if browser.is_loading():
+            browser._continue_load()
 
 
 